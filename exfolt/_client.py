@@ -1,11 +1,16 @@
+from __future__ import annotations
+from collections import deque
 from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from json import loads
+from heapq import merge
+from itertools import chain
 from logging import getLogger
-from queue import Queue
-from typing import Any, Dict, List, Literal, Tuple
+from time import monotonic
+from types import TracebackType
+from typing import Any, Deque, Dict, Iterator, List, Literal, Tuple
 
-from httpx import Client
+from httpx import Client, Response
 
 try:
     import h2
@@ -20,7 +25,6 @@ from ._type import (
     AudioStreams,
     BestSector,
     BestSpeeds,
-    CarData,
     ContentStreams,
     CurrentTyres,
     Driver,
@@ -28,7 +32,6 @@ from ._type import (
     Hub,
     LapCount,
     PersonalBestLapTime,
-    Position,
     RaceControlMessages,
     SessionData,
     SessionInfo,
@@ -53,7 +56,7 @@ from ._type import (
     WeatherData,
     YearIndex,
 )
-from ._utils import datetime_parser, decompress_zlib_data
+from ._utils import datetime_parser, decompress_zlib_data, json_loads
 
 
 class F1LTStreamingFeedInvokation(SignalRInvokation):
@@ -88,7 +91,8 @@ class F1ArchiveClient:
         self.__load_data()
         return self
 
-    def __exit__(self, *args):
+    def __exit__(self, exc_type: type[BaseException] | None, exc: BaseException | None,
+                 tb: TracebackType | None):
         return
 
     def __init__(self, path: str, *topics: StreamingTopic, client: Client | None = None):
@@ -98,13 +102,14 @@ class F1ArchiveClient:
         r = client.get(f"{F1ArchiveClient.static_url}/{path}ArchiveStatus.json")
         r.raise_for_status()
 
-        archive_status: ArchiveStatus = loads(r.content.decode("utf-8-sig"))
+        archive_status: ArchiveStatus = json_loads(r.content.decode("utf-8-sig"))
         status = archive_status["Status"]
         assert status == "Complete", f"Unexpected archive status \"{status}\"!"
 
-        self.__data_queue: Queue[Tuple[StreamingTopic, Dict[str, Any], str]] = Queue()
+        self.__data_queue: Deque[Tuple[StreamingTopic, Dict[str, Any], str]] = deque()
 
         self.__path = path
+        self.__base_url = f"{F1ArchiveClient.static_url}/{path}"
         self.__topics = topics
         self.__client = client
 
@@ -112,47 +117,79 @@ class F1ArchiveClient:
         return self
 
     def __next__(self):
-        if self.__data_queue.qsize() == 0:
-            raise StopIteration
+        try:
+            return self.__data_queue.popleft()
 
-        return self.__data_queue.get()
+        except IndexError:
+            raise StopIteration from None
 
-    def __load_data(self):
-        data_entries: List[Tuple[StreamingTopic, Dict[str, Any], str]] = []
-
-        for topic in self.__topics:
-            self.__logger.info(f"Requesting F1 Live Timing archived topic {topic} data for " +
-                               f"session with path {self.__path}!")
-            res = self.__client.get(
-                f"{F1ArchiveClient.static_url}/{self.__path}{topic}.jsonStream")
+    def __fetch_topic(self, topic: StreamingTopic):
+        self.__logger.info(f"Requesting F1 Live Timing archived topic {topic} data for " +
+                           f"session with path {self.__path}!")
 
+        with self.__client.stream("GET", f"{self.__base_url}{topic}.jsonStream") as res:
             if res.status_code == 404:
                 self.__logger.warn(f"{topic} not available for archived session with path " +
                                    f"{self.__path}!")
-                continue
+                return []
 
             res.raise_for_status()
+            topic_name = str(topic)
 
-            if not topic.endswith(".z"):
-                data_entries.extend([
-                    (str(topic), loads(data_entry[12:]), data_entry[:12])
-                    for data_entry
-                    in res.content.decode(encoding="utf-8-sig").replace("\r", "").split("\n")
-                    if len(data_entry) > 0
-                ])
+            if not topic_name.endswith(".z"):
+                return [
+                    (topic_name, json_loads(data_entry[12:]), data_entry[:12].decode("ascii"))
+                    for data_entry in F1ArchiveClient.__iter_lines(res)
+                ]
 
-            else:
-                data_entries.extend([
-                    (str(topic), data_entry[13:-1], data_entry[:12])
-                    for data_entry
-                    in res.content.decode(encoding="utf-8-sig").replace("\r", "").split("\n")
-                    if len(data_entry) > 0
-                ])
+            return [
+                (topic_name, data_entry[13:-1].decode("ascii"), data_entry[:12].decode("ascii"))
+                for data_entry in F1ArchiveClient.__iter_lines(res)
+            ]
+
+    @staticmethod
+    def __iter_lines(res: Response):
+        # Split on b"\n" only, Response.iter_lines also breaks on U+2028/U+0085 inside JSON strings
+        chunks = res.iter_bytes()
+        head = bytearray()
+
+        for chunk in chunks:
+            head += chunk
+
+            if len(head) >= 3:
+                break
 
-        data_entries.sort(key=lambda entry: entry[2])
+        buffer = bytearray()
 
-        for data_entry in data_entries:
-            self.__data_queue.put(data_entry)
+        for chunk in chain((head.removeprefix(b"\xef\xbb\xbf"),), chunks):
+            search_from = len(buffer)
+            buffer += chunk
+            line_start = 0
+            line_end = buffer.find(b"\n", search_from)
+
+            while line_end != -1:
+                content_end = line_end - 1 if buffer[line_end - 1:line_end] == b"\r" else line_end
+
+                if content_end > line_start:
+                    yield buffer[line_start:content_end]
+
+                line_start = line_end + 1
+                line_end = buffer.find(b"\n", line_start)
+
+            del buffer[:line_start]
+
+        buffer = buffer.removesuffix(b"\r")
+
+        if len(buffer) > 0:
+            yield buffer
+
+    def __load_data(self):
+        with ThreadPoolExecutor(max_workers=min(len(self.__topics), 16) or 1) as executor:
+            topic_entries: List[List[Tuple[StreamingTopic, Dict[str, Any], str]]] = \
+                list(executor.map(self.__fetch_topic, self.__topics))
+
+        # Each topic stream is already in timestamp order
+        self.__data_queue.extend(merge(*topic_entries, key=lambda entry: entry[2]))
 
     @classmethod
     def get_by_session_info(cls, year: int, meeting: int, session: int, *topics: StreamingTopic,
@@ -184,7 +221,7 @@ class F1ArchiveClient:
         res = client.get(f"{F1ArchiveClient.static_url}/StreamingStatus.json")
         res.raise_for_status()
 
-        streaming_status: StreamingStatus = loads(res.content.decode("utf-8-sig"))
+        streaming_status: StreamingStatus = json_loads(res.content.decode("utf-8-sig"))
         assert streaming_status["Status"] in ["Available", "Offline"], \
             "F1 Live Timing currently streaming!"
 
@@ -192,7 +229,7 @@ class F1ArchiveClient:
         res = client.get(f"{F1ArchiveClient.static_url}/SessionInfo.json")
         res.raise_for_status()
 
-        session_info: SessionInfo = loads(res.content.decode("utf-8-sig"))
+        session_info: SessionInfo = json_loads(res.content.decode("utf-8-sig"))
         return cls(session_info["Path"], *topics, client=client)
 
     @staticmethod
@@ -244,7 +281,7 @@ class F1ArchiveClient:
         r = client.get(f"{F1ArchiveClient.static_url}/Index.json")
         r.raise_for_status()
 
-        index: StaticIndex = loads(r.content.decode("utf-8-sig"))
+        index: StaticIndex = json_loads(r.content.decode("utf-8-sig"))
         return index
 
     @property
@@ -252,7 +289,7 @@ class F1ArchiveClient:
         r = self.__client.get(f"{F1ArchiveClient.static_url}/{self.__path}Index.json")
         r.raise_for_status()
 
-        index: SessionTopicsIndex = loads(r.content.decode("utf-8-sig"))
+        index: SessionTopicsIndex = json_loads(r.content.decode("utf-8-sig"))
         return index
 
     @staticmethod
@@ -275,7 +312,7 @@ class F1ArchiveClient:
         r = client.get(f"{F1ArchiveClient.static_url}/{year}/Index.json")
         r.raise_for_status()
 
-        year_index: YearIndex = loads(r.content.decode("utf-8-sig"))
+        year_index: YearIndex = json_loads(r.content.decode("utf-8-sig"))
         return year_index
 
 
@@ -298,26 +335,26 @@ class F1LiveClient(SignalRClient):
         self.invoke(Hub.STREAMING, "Subscribe", self.__topics)
         return self
 
-    def __exit__(self, *args):
+    def __exit__(self, exc_type: type[BaseException] | None, exc: BaseException | None,
+                 tb: TracebackType | None):
         if self.connected:
             F1LiveClient.__logger.info("Invoking 'Unsubscribe' method on 'streaming' hub with" +
                                        f" topics {self.__topics}")
             self.invoke(Hub.STREAMING, "Unsubscribe", self.__topics)
 
-        super().__exit__()
+        super().__exit__(exc_type, exc, tb)
 
     def __next__(self):
         while self.connected:
             opcode, data = super().__next__()
 
-            if "R" in data:
-                return None, data["R"]
+            invokations: List[F1LTStreamingFeedInvokation] | None = data.get("M")
 
-            if "M" not in data or len(data["M"]) == 0:
-                continue
+            if invokations:
+                return invokations, None
 
-            invokations: List[F1LTStreamingFeedInvokation] = data["M"]
-            return invokations, None
+            if "R" in data:
+                return None, data["R"]
 
         raise StopIteration
 
@@ -327,615 +364,553 @@ class F1LiveClient(SignalRClient):
 
         res = client.get(f"{F1ArchiveClient.static_url}/StreamingStatus.json")
         res.raise_for_status()
-        data: StreamingStatus = loads(res.content.decode("utf-8-sig"))
+        data: StreamingStatus = json_loads(res.content.decode("utf-8-sig"))
         return data["Status"]
 
 
 class F1TimingClient:
-    def __init__(self):
-        self.__archive_status = None
-        self.__audio_streams = None
-        self.__car_data = None
-        self.__content_streams = None
-        self.__current_tyres = None
-        self.__driver_list = None
-        self.__extrapolated_clock = None
-        self.__lap_count = None
-        self.__position = None
-        self.__race_control_messages = None
-        self.__session_data = None
-        self.__session_info = None
-        self.__session_status = None
-        self.__team_radio = None
-        self.__timing_app_data = None
-        self.__timing_data = None
-        self.__timing_stats = None
-        self.__track_status = None
-        self.__weather_data = None
-
-    def process_reply(self, old_data: Dict[StreamingTopic, Any]):
-        if StreamingTopic.ARCHIVE_STATUS in old_data:
-            archive_status: ArchiveStatus = old_data[StreamingTopic.ARCHIVE_STATUS]
-            self.__archive_status = archive_status
-
-        if StreamingTopic.AUDIO_STREAMS in old_data:
-            audio_streams: AudioStreams = old_data[StreamingTopic.AUDIO_STREAMS]
-            self.__audio_streams = audio_streams
-
-        if StreamingTopic.CAR_DATA_Z in old_data:
-            car_data: CarData = loads(decompress_zlib_data(old_data[StreamingTopic.CAR_DATA_Z]))
-            self.__car_data = car_data
-
-        if StreamingTopic.CONTENT_STREAMS in old_data:
-            content_streams: ContentStreams = old_data[StreamingTopic.CONTENT_STREAMS]
-            self.__content_streams = content_streams
-
-        if StreamingTopic.CURRENT_TYRES in old_data:
-            current_tyres: CurrentTyres = old_data[StreamingTopic.CURRENT_TYRES]
-            self.__current_tyres = current_tyres
+    __slots__ = ("__data", "__handlers")
 
-        if StreamingTopic.DRIVER_LIST in old_data:
-            drivers: Dict[str, Driver] = old_data[StreamingTopic.DRIVER_LIST]
-            self.__driver_list = drivers
-
-        if StreamingTopic.EXTRAPOLATED_CLOCK in old_data:
-            extrapolated_clock: ExtrapolatedClock = \
-                old_data[StreamingTopic.EXTRAPOLATED_CLOCK]
-            self.__extrapolated_clock = extrapolated_clock
-
-        if StreamingTopic.LAP_COUNT in old_data:
-            lap_count: LapCount = old_data[StreamingTopic.LAP_COUNT]
-            self.__lap_count = lap_count
-
-        if StreamingTopic.POSITION_Z in old_data:
-            position: Position = loads(decompress_zlib_data(old_data[StreamingTopic.POSITION_Z]))
-            self.__position = position
-
-        if StreamingTopic.RACE_CONTROL_MESSAGES in old_data:
-            race_control_messages: RaceControlMessages = \
-                old_data[StreamingTopic.RACE_CONTROL_MESSAGES]
-            self.__race_control_messages = race_control_messages
-
-        if StreamingTopic.SESSION_DATA in old_data:
-            session_data: SessionData = old_data[StreamingTopic.SESSION_DATA]
-            self.__session_data = session_data
-
-        if StreamingTopic.SESSION_INFO in old_data:
-            session_info: SessionInfo = old_data[StreamingTopic.SESSION_INFO]
-            self.__session_info = session_info
-
-        if StreamingTopic.SESSION_STATUS in old_data:
-            session_status: SessionStatus = old_data[StreamingTopic.SESSION_STATUS]
-            self.__session_status = session_status
-
-        if StreamingTopic.TEAM_RADIO in old_data:
-            team_radio: TeamRadio = old_data[StreamingTopic.TEAM_RADIO]
-            self.__team_radio = team_radio
+    def __init__(self):
+        self.__data: Dict[StreamingTopic, Any] = dict.fromkeys((
+            StreamingTopic.ARCHIVE_STATUS,
+            StreamingTopic.AUDIO_STREAMS,
+            StreamingTopic.CAR_DATA_Z,
+            StreamingTopic.CONTENT_STREAMS,
+            StreamingTopic.CURRENT_TYRES,
+            StreamingTopic.DRIVER_LIST,
+            StreamingTopic.EXTRAPOLATED_CLOCK,
+            StreamingTopic.LAP_COUNT,
+            StreamingTopic.POSITION_Z,
+            StreamingTopic.RACE_CONTROL_MESSAGES,
+            StreamingTopic.SESSION_DATA,
+            StreamingTopic.SESSION_INFO,
+            StreamingTopic.SESSION_STATUS,
+            StreamingTopic.TEAM_RADIO,
+            StreamingTopic.TIMING_APP_DATA,
+            StreamingTopic.TIMING_DATA,
+            StreamingTopic.TIMING_STATS,
+            StreamingTopic.TRACK_STATUS,
+            StreamingTopic.WEATHER_DATA,
+        ))
+        self.__handlers = {
+            StreamingTopic.ARCHIVE_STATUS: self.__process_archive_status,
+            StreamingTopic.AUDIO_STREAMS: self.__process_audio_streams,
+            StreamingTopic.CAR_DATA_Z: self.__process_car_data,
+            StreamingTopic.CONTENT_STREAMS: self.__process_content_streams,
+            StreamingTopic.CURRENT_TYRES: self.__process_current_tyres,
+            StreamingTopic.DRIVER_LIST: self.__process_driver_list,
+            StreamingTopic.EXTRAPOLATED_CLOCK: self.__process_extrapolated_clock,
+            StreamingTopic.LAP_COUNT: self.__process_lap_count,
+            StreamingTopic.POSITION_Z: self.__process_position,
+            StreamingTopic.RACE_CONTROL_MESSAGES: self.__process_race_control_messages,
+            StreamingTopic.SESSION_DATA: self.__process_session_data,
+            StreamingTopic.SESSION_INFO: self.__process_session_info,
+            StreamingTopic.SESSION_STATUS: self.__process_session_status,
+            StreamingTopic.TEAM_RADIO: self.__process_team_radio,
+            StreamingTopic.TIMING_APP_DATA: self.__process_timing_app_data,
+            StreamingTopic.TIMING_DATA: self.__process_timing_data,
+            StreamingTopic.TIMING_STATS: self.__process_timing_stats,
+            StreamingTopic.TRACK_STATUS: self.__process_track_status,
+            StreamingTopic.WEATHER_DATA: self.__process_weather_data,
+        }
+
+    def __process_archive_status(self, archive_status: ArchiveStatus, timestamp: str):
+        if self.__data[StreamingTopic.ARCHIVE_STATUS] is None:
+            self.__data[StreamingTopic.ARCHIVE_STATUS] = archive_status
 
-        if StreamingTopic.TIMING_APP_DATA in old_data:
-            timing_app_data: TimingAppData = old_data[StreamingTopic.TIMING_APP_DATA]
-            self.__timing_app_data = timing_app_data
+        else:
+            self.__data[StreamingTopic.ARCHIVE_STATUS] |= archive_status
 
-        if StreamingTopic.TIMING_DATA in old_data:
-            timing_data: TimingData = old_data[StreamingTopic.TIMING_DATA]
-            self.__timing_data = timing_data
+    def __process_audio_streams(self, audio_streams: AudioStreams, timestamp: str):
+        if isinstance(audio_streams["Streams"], Mapping):
+            assert self.__data[StreamingTopic.AUDIO_STREAMS] is not None
 
-        if StreamingTopic.TIMING_STATS in old_data:
-            timing_stats: TimingStats = old_data[StreamingTopic.TIMING_STATS]
-            self.__timing_stats = timing_stats
+            self.__data[StreamingTopic.AUDIO_STREAMS]["Streams"].extend(
+                audio_streams["Streams"].values())
 
-        if StreamingTopic.TRACK_STATUS in old_data:
-            track_status: TrackStatus = old_data[StreamingTopic.TRACK_STATUS]
-            self.__track_status = track_status
+        else:
+            self.__data[StreamingTopic.AUDIO_STREAMS] = audio_streams
 
-        if StreamingTopic.WEATHER_DATA in old_data:
-            weather_data: WeatherData = old_data[StreamingTopic.WEATHER_DATA]
-            self.__weather_data = weather_data
+    def __process_car_data(self, update_data: str, timestamp: str):
+        pass
 
-    def process_invokation(self, topic: StreamingTopic, update_data: dict, timestamp: datetime):
-        if topic == StreamingTopic.ARCHIVE_STATUS:
-            archive_status: ArchiveStatus = update_data
+    def __process_content_streams(self, content_streams: ContentStreams, timestamp: str):
+        if isinstance(content_streams["Streams"], Mapping):
+            assert self.__data[StreamingTopic.CONTENT_STREAMS] is not None
 
-            if self.__archive_status is None:
-                self.__archive_status = archive_status
+            self.__data[StreamingTopic.CONTENT_STREAMS]["Streams"].extend(
+                content_streams["Streams"].values())
 
-            else:
-                self.__archive_status |= archive_status
+        else:
+            self.__data[StreamingTopic.CONTENT_STREAMS] = content_streams
 
-        elif topic == StreamingTopic.AUDIO_STREAMS:
-            audio_streams: AudioStreams = update_data
+    def __process_current_tyres(self, current_tyres: CurrentTyres, timestamp: str):
+        current_current_tyres: CurrentTyres | None = self.__data[StreamingTopic.CURRENT_TYRES]
 
-            if isinstance(audio_streams["Streams"], Mapping):
-                assert self.__audio_streams is not None
+        if current_current_tyres is None:
+            self.__data[StreamingTopic.CURRENT_TYRES] = current_tyres
 
-                for stream in audio_streams["Streams"].values():
-                    self.__audio_streams["Streams"].append(stream)
+        else:
+            current_tyres_data = current_current_tyres["Tyres"]
 
-            else:
-                self.__audio_streams = audio_streams
+            for rn, driver_current_tyre in current_tyres["Tyres"].items():
+                current_driver_tyre = current_tyres_data.get(rn)
 
-        elif topic == StreamingTopic.CAR_DATA_Z:
-            pass
+                if current_driver_tyre is None:
+                    current_tyres_data[rn] = driver_current_tyre
 
-        elif topic == StreamingTopic.CONTENT_STREAMS:
-            content_streams: ContentStreams = update_data
+                else:
+                    current_driver_tyre |= driver_current_tyre
 
-            if isinstance(content_streams["Streams"], Mapping):
-                assert self.__content_streams is not None
+    def __process_driver_list(self, driver_list: Dict[str, Driver], timestamp: str):
+        current_driver_list: Dict[str, Driver] | None = self.__data[StreamingTopic.DRIVER_LIST]
 
-                for stream in content_streams["Streams"].values():
-                    self.__content_streams["Streams"].append(stream)
+        if current_driver_list is None:
+            self.__data[StreamingTopic.DRIVER_LIST] = driver_list
 
-            else:
-                self.__content_streams = content_streams
+        else:
+            for rn, driver_data in driver_list.items():
+                current_driver = current_driver_list.get(rn)
 
-        elif topic == StreamingTopic.CURRENT_TYRES:
-            current_tyres: CurrentTyres = update_data
+                if current_driver is None:
+                    current_driver_list[rn] = driver_data
 
-            if self.__current_tyres is None:
-                self.__current_tyres = current_tyres
+                else:
+                    current_driver |= driver_data
 
-            else:
-                for rn, driver_current_tyre in current_tyres["Tyres"].items():
-                    if rn in self.__current_tyres["Tyres"]:
-                        self.__current_tyres["Tyres"][rn] |= driver_current_tyre
+    def __process_extrapolated_clock(self, extrapolated_clock: ExtrapolatedClock,
+                                     timestamp: str):
+        if self.__data[StreamingTopic.EXTRAPOLATED_CLOCK] is None:
+            self.__data[StreamingTopic.EXTRAPOLATED_CLOCK] = extrapolated_clock
 
-                    else:
-                        self.__current_tyres["Tyres"][rn] = driver_current_tyre
+        else:
+            self.__data[StreamingTopic.EXTRAPOLATED_CLOCK] |= extrapolated_clock
 
-        elif topic == StreamingTopic.DRIVER_LIST:
-            driver_list: Dict[str, Driver] = update_data
+    def __process_lap_count(self, lap_count: LapCount, timestamp: str):
+        if self.__data[StreamingTopic.LAP_COUNT] is None:
+            self.__data[StreamingTopic.LAP_COUNT] = lap_count
 
-            if self.__driver_list is None:
-                self.__driver_list = driver_list
+        else:
+            self.__data[StreamingTopic.LAP_COUNT] |= lap_count
 
-            else:
-                for rn, driver_data in driver_list.items():
-                    if rn in self.__driver_list:
-                        self.__driver_list[rn] |= driver_data
+    def __process_position(self, update_data: str, timestamp: str):
+        pass
 
-                    else:
-                        self.__driver_list[rn] = driver_data
+    def __process_race_control_messages(self, race_control_messages: RaceControlMessages,
+                                        timestamp: str):
+        if isinstance(race_control_messages["Messages"], Mapping):
+            assert self.__data[StreamingTopic.RACE_CONTROL_MESSAGES] is not None
 
-        elif topic == StreamingTopic.EXTRAPOLATED_CLOCK:
-            extrapolated_clock: ExtrapolatedClock = update_data
+            self.__data[StreamingTopic.RACE_CONTROL_MESSAGES]["Messages"].extend(
+                race_control_messages["Messages"].values())
 
-            if self.__extrapolated_clock is None:
-                self.__extrapolated_clock = extrapolated_clock
+        else:
+            self.__data[StreamingTopic.RACE_CONTROL_MESSAGES] = race_control_messages
 
-            else:
-                self.__extrapolated_clock |= extrapolated_clock
+    def __process_session_data(self, session_data: SessionData, timestamp: str):
+        series = session_data.get("Series")
+        status_series = session_data.get("StatusSeries")
 
-        elif topic == StreamingTopic.LAP_COUNT:
-            lap_count: LapCount = update_data
+        if series is not None and status_series is not None:
+            self.__data[StreamingTopic.SESSION_DATA] = session_data
 
-            if self.__lap_count is None:
-                self.__lap_count = lap_count
+        elif series is not None:
+            assert self.__data[StreamingTopic.SESSION_DATA] is not None and \
+                isinstance(series, Mapping)
 
-            else:
-                self.__lap_count |= lap_count
+            self.__data[StreamingTopic.SESSION_DATA]["Series"].extend(series.values())
 
-        elif topic == StreamingTopic.POSITION_Z:
-            pass
+        elif status_series is not None:
+            assert self.__data[StreamingTopic.SESSION_DATA] is not None and \
+                isinstance(status_series, Mapping)
 
-        elif topic == StreamingTopic.RACE_CONTROL_MESSAGES:
-            race_control_messages: RaceControlMessages = update_data
+            self.__data[StreamingTopic.SESSION_DATA]["StatusSeries"].extend(status_series.values())
 
-            if isinstance(race_control_messages["Messages"], Mapping):
-                assert self.__race_control_messages is not None
+    def __process_session_info(self, session_info: SessionInfo, timestamp: str):
+        if "ArchiveStatus" in session_info and len(session_info) == 1:
+            current_session_info: SessionInfo = self.__data[StreamingTopic.SESSION_INFO]
+            assert current_session_info is not None
+            current_session_info["ArchiveStatus"] |= session_info["ArchiveStatus"]
 
-                for message in race_control_messages["Messages"].values():
-                    self.__race_control_messages["Messages"].append(message)
+        else:
+            self.__data[StreamingTopic.SESSION_INFO] = session_info
 
-            else:
-                self.__race_control_messages = race_control_messages
+    def __process_session_status(self, session_status: SessionStatus, timestamp: str):
+        if self.__data[StreamingTopic.SESSION_STATUS] is None:
+            self.__data[StreamingTopic.SESSION_STATUS] = session_status
 
-        elif topic == StreamingTopic.SESSION_DATA:
-            session_data: SessionData = update_data
+        else:
+            self.__data[StreamingTopic.SESSION_STATUS] |= session_status
 
-            if "Series" in session_data and "StatusSeries" in session_data:
-                self.__session_data = session_data
+    def __process_team_radio(self, team_radio: TeamRadio, timestamp: str):
+        if isinstance(team_radio["Captures"], Mapping):
+            assert self.__data[StreamingTopic.TEAM_RADIO] is not None
 
-            elif "Series" in session_data:
-                assert self.__session_data is not None and \
-                    isinstance(session_data["Series"], Mapping)
+            self.__data[StreamingTopic.TEAM_RADIO]["Captures"].extend(
+                team_radio["Captures"].values())
 
-                for series_data in session_data["Series"].values():
-                    self.__session_data["Series"].append(series_data)
+        else:
+            self.__data[StreamingTopic.TEAM_RADIO] = team_radio
 
-            elif "StatusSeries" in session_data:
-                assert self.__session_data is not None and \
-                    isinstance(session_data["StatusSeries"], Mapping)
+    def __process_timing_app_data(self, timing_app_data: TimingAppData, timestamp: str):
+        stints: Dict[str, Dict[str, TimingStint] | List[TimingStint]] = {}
 
-                for status_series_data in session_data["StatusSeries"].values():
-                    self.__session_data["StatusSeries"].append(status_series_data)
+        for rn, timing_driver_app_data in timing_app_data["Lines"].items():
+            driver_stints: Dict[str, TimingStint] | List[TimingStint] | None = \
+                timing_driver_app_data.pop("Stints", None)
 
-        elif topic == StreamingTopic.SESSION_INFO:
-            session_info: SessionInfo = update_data
+            if driver_stints is not None:
+                stints[rn] = driver_stints
 
-            if "ArchiveStatus" in session_info and len(session_info) == 1:
-                assert self.__session_info is not None
-                self.__session_info["ArchiveStatus"] |= session_info["ArchiveStatus"]
+        current_timing_app_data: TimingAppData | None = self.__data[StreamingTopic.TIMING_APP_DATA]
 
-            else:
-                self.__session_info = session_info
+        if current_timing_app_data is None:
+            self.__data[StreamingTopic.TIMING_APP_DATA] = current_timing_app_data = timing_app_data
 
-        elif topic == StreamingTopic.SESSION_STATUS:
-            session_status: SessionStatus = update_data
+        current_lines = current_timing_app_data["Lines"]
 
-            if self.__session_status is None:
-                self.__session_status = session_status
+        if current_timing_app_data is not timing_app_data:
+            for rn, timing_driver_app_data in timing_app_data["Lines"].items():
+                current_line = current_lines.get(rn)
 
-            else:
-                self.__session_status |= session_status
+                if current_line is None:
+                    current_lines[rn] = timing_driver_app_data
 
-        elif topic == StreamingTopic.TEAM_RADIO:
-            team_radio: TeamRadio = update_data
+                else:
+                    current_line |= timing_driver_app_data
 
-            if isinstance(team_radio["Captures"], Mapping):
-                assert self.__team_radio is not None
+        for rn, driver_stints in stints.items():
+            current_stints = current_lines[rn].get("Stints")
 
-                for capture in team_radio["Captures"].values():
-                    self.__team_radio["Captures"].append(capture)
+            if current_stints is None:
+                assert isinstance(driver_stints, Sequence)
+                current_lines[rn]["Stints"] = driver_stints
 
             else:
-                self.__team_radio = team_radio
-
-        elif topic == StreamingTopic.TIMING_APP_DATA:
-            timing_app_data: TimingAppData = update_data
-            stints: Dict[str, Dict[str, TimingStint] | List[TimingStint]] = {}
+                assert isinstance(driver_stints, Mapping)
+                assert isinstance(current_stints, Sequence)
 
-            rns = list(timing_app_data["Lines"].keys())
+                for sn, stint in driver_stints.items():
+                    stint_number = int(sn)
 
-            for rn in rns:
-                if "Stints" in timing_app_data["Lines"][rn]:
-                    driver_stints: Dict[str, TimingStint] | List[TimingStint] = \
-                        timing_app_data["Lines"][rn].pop("Stints")
-
-                    stints |= {rn: driver_stints}
-
-            if self.__timing_app_data is None:
-                self.__timing_app_data = timing_app_data
-
-            else:
-                for rn, timing_driver_app_data in timing_app_data["Lines"].items():
-                    if rn not in self.__timing_app_data["Lines"]:
-                        self.__timing_app_data["Lines"][rn] = timing_driver_app_data
+                    if stint_number < len(current_stints):
+                        current_stints[stint_number].update(stint)
 
                     else:
-                        self.__timing_app_data["Lines"][rn] |= timing_driver_app_data
+                        current_stints.append(stint)
 
-            for rn, driver_stints in stints.items():
-                if "Stints" not in self.__timing_app_data["Lines"][rn]:
-                    assert isinstance(driver_stints, Sequence)
-                    self.__timing_app_data["Lines"][rn]["Stints"] = driver_stints
+    def __process_timing_data(self, timing_data: TimingData, timestamp: str):
+        timing_dict_data: Dict[
+            str,
+            Tuple[
+                TimingIntervalData | None,
+                Dict[str, TimingSector] | List[TimingSector] | None,
+                TimingSpeeds | None,
+                TimingBestLapTime | None,
+                TimingLastLapTime | None,
+            ],
+        ] = {}
 
-                else:
-                    assert isinstance(driver_stints, Mapping)
-                    assert isinstance(self.__timing_app_data["Lines"][rn]["Stints"], Sequence)
+        for rn, line in timing_data["Lines"].items():
+            itpa: TimingIntervalData | None = line.pop("IntervalToPositionAhead", None)
+            sectors: Dict[str, TimingSector] | List[TimingSector] | None = \
+                line.pop("Sectors", None)
+            speeds: TimingSpeeds | None = line.pop("Speeds", None)
+            blt: TimingBestLapTime | None = line.pop("BestLapTime", None)
+            llt: TimingLastLapTime | None = line.pop("LastLapTime", None)
 
-                    for sn, stint in driver_stints.items():
-                        if int(sn) < len(self.__timing_app_data["Lines"][rn]["Stints"]):
-                            self.__timing_app_data["Lines"][rn]["Stints"][int(sn)].update(stint)
+            timing_dict_data[rn] = (itpa, sectors, speeds, blt, llt)
 
-                        else:
-                            self.__timing_app_data["Lines"][rn]["Stints"].append(stint)
-
-        elif topic == StreamingTopic.TIMING_DATA:
-            timing_data: TimingData = update_data
-            timing_dict_data: Dict[
-                str,
-                Tuple[
-                    TimingIntervalData | None,
-                    Dict[str, TimingSector] | List[TimingSector] | None,
-                    TimingSpeeds | None,
-                    TimingBestLapTime | None,
-                    TimingLastLapTime | None,
-                ],
-            ] = {}
-
-            rns = list(timing_data["Lines"].keys())
-
-            for rn in rns:
-                if "IntervalToPositionAhead" in timing_data["Lines"][rn]:
-                    itpa: TimingIntervalData = \
-                        timing_data["Lines"][rn].pop("IntervalToPositionAhead")
+        current_timing_data: TimingData | None = self.__data[StreamingTopic.TIMING_DATA]
 
-                else:
-                    itpa = None
+        if current_timing_data is None:
+            self.__data[StreamingTopic.TIMING_DATA] = current_timing_data = timing_data
 
-                if "Sectors" in timing_data["Lines"][rn]:
-                    sectors: Dict[str, TimingSector] | List[TimingSector] = \
-                        timing_data["Lines"][rn].pop("Sectors")
+        current_lines = current_timing_data["Lines"]
 
-                else:
-                    sectors = None
+        if current_timing_data is not timing_data:
+            for rn, line in timing_data["Lines"].items():
+                current_lines[rn] |= line
 
-                if "Speeds" in timing_data["Lines"][rn]:
-                    speeds: TimingSpeeds = timing_data["Lines"][rn].pop("Speeds")
+        for rn, dd in timing_dict_data.items():
+            (itpa, sectors, speeds, blt, llt) = dd
+            current_line = current_lines[rn]
 
-                else:
-                    speeds = None
+            if itpa is not None:
+                current_itpa = current_line.get("IntervalToPositionAhead")
 
-                if "BestLapTime" in timing_data["Lines"][rn]:
-                    blt: TimingBestLapTime = timing_data["Lines"][rn].pop("BestLapTime")
+                if current_itpa is None:
+                    current_line["IntervalToPositionAhead"] = itpa
 
                 else:
-                    blt = None
+                    current_itpa |= itpa
 
-                if "LastLapTime" in timing_data["Lines"][rn]:
-                    llt: TimingLastLapTime = timing_data["Lines"][rn].pop("LastLapTime")
+            if sectors is not None:
+                if isinstance(sectors, Sequence):
+                    current_line["Sectors"] = sectors
 
                 else:
-                    llt = None
+                    current_sectors = current_line["Sectors"]
 
-                timing_dict_data |= {rn: (itpa, sectors, speeds, blt, llt)}
+                    for sn, sd in sectors.items():
+                        segments: Dict[str, TimingSegment] | List[TimingSegment] | None = \
+                            sd.pop("Segments", None)
 
-            if self.__timing_data is None:
-                self.__timing_data = timing_data
-
-            else:
-                for rn in timing_data["Lines"].keys():
-                    self.__timing_data["Lines"][rn] |= timing_data["Lines"][rn]
+                        current_sector = current_sectors[int(sn)]
+                        current_sector |= sd
 
-            for rn, dd in timing_dict_data.items():
-                (itpa, sectors, speeds, blt, llt) = dd
+                        if segments is not None:
+                            if isinstance(segments, Mapping):
+                                current_segments = current_sector["Segments"]
 
-                if itpa is not None:
-                    if "IntervalToPositionAhead" not in self.__timing_data["Lines"][rn]:
-                        self.__timing_data["Lines"][rn]["IntervalToPositionAhead"] = itpa
+                                for seg_num, seg_data in segments.items():
+                                    current_segments[int(seg_num)] |= seg_data
 
-                    else:
-                        self.__timing_data["Lines"][rn]["IntervalToPositionAhead"] |= itpa
-
-                if sectors is not None:
-                    if isinstance(sectors, Sequence):
-                        self.__timing_data["Lines"][rn]["Sectors"] = sectors
+                            else:
+                                current_sector["Segments"] = segments
 
-                    else:
-                        for sn, sd in sectors.items():
-                            segments = None
+            if speeds is not None:
+                current_speeds = current_line.get("Speeds")
 
-                            if "Segments" in sd:
-                                segments: Dict[str, TimingSegment] | List[TimingSegment] = \
-                                    sd.pop("Segments")
+                if current_speeds is None or isinstance(speeds, Sequence):
+                    current_line["Speeds"] = speeds
 
-                            self.__timing_data["Lines"][rn]["Sectors"][int(sn)] |= sd
+                else:
+                    for key, speed_data in speeds.items():
+                        current_speed_data = current_speeds.get(key)
 
-                            if segments is not None:
-                                if isinstance(segments, Mapping):
-                                    for seg_num, seg_data in segments.items():
-                                        self_sectors = self.__timing_data["Lines"][rn]["Sectors"]
-                                        self_sectors[int(sn)]["Segments"][int(seg_num)] |= \
-                                            seg_data
+                        if current_speed_data is None:
+                            current_speeds[key] = speed_data
 
-                                else:
-                                    self_sectors = self.__timing_data["Lines"][rn]["Sectors"]
-                                    self_sectors[int(sn)]["Segments"] = segments
+                        else:
+                            current_speed_data |= speed_data
 
-                if speeds is not None:
-                    if "Speeds" not in self.__timing_data["Lines"][rn] or \
-                            isinstance(speeds, Sequence):
-                        self.__timing_data["Lines"][rn]["Speeds"] = speeds
+            if blt is not None:
+                current_blt = current_line.get("BestLapTime")
 
-                    else:
-                        for key, speed_data in speeds.items():
-                            if key not in self.__timing_data["Lines"][rn]["Speeds"]:
-                                self.__timing_data["Lines"][rn]["Speeds"][key] = speed_data
+                if current_blt is None:
+                    current_line["BestLapTime"] = blt
 
-                            else:
-                                self.__timing_data["Lines"][rn]["Speeds"][key] |= speed_data
+                else:
+                    current_blt |= blt
 
-                if blt is not None:
-                    if "BestLapTime" not in self.__timing_data["Lines"][rn]:
-                        self.__timing_data["Lines"][rn]["BestLapTime"] = blt
+            if llt is not None:
+                current_llt = current_line.get("LastLapTime")
 
-                    else:
-                        self.__timing_data["Lines"][rn]["BestLapTime"] |= blt
+                if current_llt is None:
+                    current_line["LastLapTime"] = llt
 
-                if llt is not None:
-                    if "LastLapTime" not in self.__timing_data["Lines"][rn]:
-                        self.__timing_data["Lines"][rn]["LastLapTime"] = llt
+                else:
+                    current_llt |= llt
 
-                    else:
-                        self.__timing_data["Lines"][rn]["LastLapTime"] |= llt
+    def __process_timing_stats(self, timing_stats: TimingStats, timestamp: str):
+        lines: Dict[str, TimingStatsLine] | None = timing_stats.pop("Lines", None)
+        current_timing_stats: TimingStats | None = self.__data[StreamingTopic.TIMING_STATS]
 
-        elif topic == StreamingTopic.TIMING_STATS:
-            timing_stats: TimingStats = update_data
+        if current_timing_stats is None:
+            self.__data[StreamingTopic.TIMING_STATS] = current_timing_stats = timing_stats
 
-            lines = None
+        else:
+            current_timing_stats |= timing_stats
 
-            if "Lines" in timing_stats:
-                lines: Dict[str, TimingStatsLine] = timing_stats.pop("Lines")
+        if lines is not None:
+            current_lines: Dict[str, TimingStatsLine] | None = current_timing_stats.get("Lines")
 
-            if self.__timing_stats is None:
-                self.__timing_stats = timing_stats
+            if current_lines is None:
+                current_timing_stats["Lines"] = lines
 
             else:
-                self.__timing_stats |= timing_stats
+                for rn, tsl in lines.items():
+                    pblt: PersonalBestLapTime | None = tsl.pop("PersonalBestLapTime", None)
+                    b_sectors: Dict[str, BestSector] | List[BestSector] | None = \
+                        tsl.pop("BestSectors", None)
+                    b_speeds: BestSpeeds | None = tsl.pop("BestSpeeds", None)
 
-            if lines is not None:
-                if "Lines" not in self.__timing_stats:
-                    self.__timing_stats["Lines"] = lines
+                    current_line = current_lines[rn]
+                    current_line |= tsl
 
-                else:
-                    for rn, tsl in lines.items():
-                        if "PersonalBestLapTime" in tsl:
-                            pblt: PersonalBestLapTime = tsl.pop("PersonalBestLapTime")
+                    if pblt is not None:
+                        current_pblt = current_line.get("PersonalBestLapTime")
 
-                        else:
-                            pblt = None
-
-                        if "BestSectors" in tsl:
-                            b_sectors: Dict[str, BestSector] | List[BestSector] = \
-                                tsl.pop("BestSectors")
+                        if current_pblt is None:
+                            current_line["PersonalBestLapTime"] = pblt
 
                         else:
-                            b_sectors = None
+                            current_pblt |= pblt
 
-                        if "BestSpeeds" in tsl:
-                            b_speeds: BestSpeeds = tsl.pop("BestSpeeds")
+                    if b_sectors is not None:
+                        current_b_sectors = current_line.get("BestSectors")
 
-                        else:
-                            b_speeds = None
+                        if current_b_sectors is not None and isinstance(b_sectors, Mapping):
+                            for sn, sd in b_sectors.items():
+                                current_b_sectors[int(sn)] |= sd
 
-                        self.__timing_stats["Lines"][rn] |= tsl
+                        else:
+                            current_line["BestSectors"] = b_sectors
 
-                        if pblt is not None:
-                            if "PersonalBestLapTime" not in self.__timing_stats["Lines"][rn]:
-                                self.__timing_stats["Lines"][rn]["PersonalBestLapTime"] = pblt
+                    if b_speeds is not None:
+                        current_b_speeds = current_line.get("BestSpeeds")
 
-                            else:
-                                self.__timing_stats["Lines"][rn]["PersonalBestLapTime"] |= pblt
+                        if current_b_speeds is None:
+                            current_line["BestSpeeds"] = b_speeds
 
-                        if b_sectors is not None:
-                            if (
-                                "BestSectors" in self.__timing_stats["Lines"][rn] and
-                                isinstance(b_sectors, Mapping)
-                            ):
-                                for sn, sd in b_sectors.items():
-                                    self.__timing_stats["Lines"][rn]["BestSectors"][int(sn)] |= sd
+                        else:
+                            for k, sd in b_speeds.items():
+                                current_b_speeds[k] |= sd
 
-                            else:
-                                self.__timing_stats["Lines"][rn]["BestSectors"] = b_sectors
+    def __process_track_status(self, track_status: TrackStatus, timestamp: str):
+        self.__data[StreamingTopic.TRACK_STATUS] = track_status
 
-                        if b_speeds is not None:
-                            if "BestSpeeds" not in self.__timing_stats["Lines"][rn]:
-                                self.__timing_stats["Lines"][rn]["BestSpeeds"] = b_speeds
+    def __process_weather_data(self, weather_data: WeatherData, timestamp: str):
+        self.__data[StreamingTopic.WEATHER_DATA] = weather_data
 
-                            else:
-                                for k, sd in b_speeds.items():
-                                    self.__timing_stats["Lines"][rn]["BestSpeeds"][k] |= sd
+    def process_reply(self, old_data: Dict[StreamingTopic, Any]):
+        for topic, data in old_data.items():
+            if topic not in self.__data:
+                continue
 
-        elif topic == StreamingTopic.TRACK_STATUS:
-            track_status: TrackStatus = update_data
-            self.__track_status = track_status
+            if data and topic in (StreamingTopic.CAR_DATA_Z, StreamingTopic.POSITION_Z):
+                data = json_loads(decompress_zlib_data(data))
 
-        elif topic == StreamingTopic.WEATHER_DATA:
-            weather_data: WeatherData = update_data
-            self.__weather_data = weather_data
+            self.__data[topic] = data
 
-        else:
-            assert False, "Unknown update topic!"
+    def process_invokation(self, topic: StreamingTopic, update_data: Any, timestamp: str) -> None:
+        handler = self.__handlers.get(topic)
+        assert handler is not None, "Unknown update topic!"
+        handler(update_data, timestamp)
 
     @property
     def archive_status(self):
-        return self.__archive_status
+        return self.__data[StreamingTopic.ARCHIVE_STATUS]
 
     @property
     def audio_streams(self):
-        return self.__audio_streams
+        return self.__data[StreamingTopic.AUDIO_STREAMS]
 
     @property
     def car_data(self):
-        return self.__car_data
+        return self.__data[StreamingTopic.CAR_DATA_Z]
 
     @property
     def content_streams(self):
-        return self.__content_streams
+        return self.__data[StreamingTopic.CONTENT_STREAMS]
 
     @property
     def current_tyres(self):
-        return self.__current_tyres
+        return self.__data[StreamingTopic.CURRENT_TYRES]
 
     @property
     def driver_list(self):
-        return self.__driver_list
+        return self.__data[StreamingTopic.DRIVER_LIST]
 
     @property
     def extrapolated_clock(self):
-        return self.__extrapolated_clock
+        return self.__data[StreamingTopic.EXTRAPOLATED_CLOCK]
 
     @property
     def lap_count(self):
-        return self.__lap_count
+        return self.__data[StreamingTopic.LAP_COUNT]
 
     @property
     def position(self):
-        return self.__position
+        return self.__data[StreamingTopic.POSITION_Z]
 
     @property
     def race_control_messages(self):
-        return self.__race_control_messages
+        return self.__data[StreamingTopic.RACE_CONTROL_MESSAGES]
 
     @property
     def session_data(self):
-        return self.__session_data
+        return self.__data[StreamingTopic.SESSION_DATA]
 
     @property
     def session_info(self):
-        return self.__session_info
+        return self.__data[StreamingTopic.SESSION_INFO]
 
     @property
     def session_status(self):
-        return self.__session_status
+        return self.__data[StreamingTopic.SESSION_STATUS]
 
     @property
     def team_radio(self):
-        return self.__team_radio
+        return self.__data[StreamingTopic.TEAM_RADIO]
 
     @property
     def timing_app_data(self):
-        return self.__timing_app_data
+        return self.__data[StreamingTopic.TIMING_APP_DATA]
 
     @property
     def timing_data(self):
-        return self.__timing_data
+        return self.__data[StreamingTopic.TIMING_DATA]
 
     @property
     def timing_stats(self):
-        return self.__timing_stats
+        return self.__data[StreamingTopic.TIMING_STATS]
 
     @property
     def track_status(self):
-        return self.__track_status
+        return self.__data[StreamingTopic.TRACK_STATUS]
 
     @property
     def weather_data(self):
-        return self.__weather_data
+        return self.__data[StreamingTopic.WEATHER_DATA]
 
 
 class F1LiveTimingClient:
+    __slots__ = ("__lc", "__tc")
+
     def __init__(self, *topics: StreamingTopic, reconnect: bool = True):
-        self.__lc = F1LiveClient(*topics, reconnect=reconnect)
-        self.__tc = F1TimingClient()
+        self.__lc: F1LiveClient = F1LiveClient(*topics, reconnect=reconnect)
+        self.__tc: F1TimingClient = F1TimingClient()
 
-    def __enter__(self):
+    def __enter__(self) -> F1LiveTimingClient:
         self.__lc.__enter__()
         return self
 
-    def __exit__(self, *args):
-        self.__lc.__exit__()
+    def __exit__(self, exc_type: type[BaseException] | None, exc: BaseException | None,
+                 tb: TracebackType | None) -> None:
+        self.__lc.__exit__(exc_type, exc, tb)
 
-    def __iter__(self):
-        return self
-
-    def __next__(self):
-        while self.__lc.connected:
-            invokations, reply = next(self.__lc)
+    def __iter__(self) -> Iterator[Tuple[StreamingTopic, Any, datetime]]:
+        for invokations, reply in self.__lc:
+            if invokations is not None:
+                yield from map(self.__process_invokation, filter(None, invokations))
 
-            if reply:
+            elif reply:
                 self.__tc.process_reply(reply)
 
-            else:
-                if invokations is not None:
-                    for invokation in invokations:
-                        if invokation is not None:
-                            self.__tc.process_invokation(*invokation["A"])
+    def __process_invokation(self, invokation: F1LTStreamingFeedInvokation):
+        topic, change, timestamp = invokation["A"]
+        topic = StreamingTopic(topic)
+        self.__tc.process_invokation(topic, change, timestamp)
+        return topic, change, datetime_parser(timestamp)
 
-                    return [(StreamingTopic(invokation["A"][0]), invokation["A"][1],
-                            datetime_parser(invokation["A"][2])) for invokation in invokations
-                            if invokation is not None]
+    def drain(self, max_wait_ms: float = 1) -> List[Tuple[StreamingTopic, Any, datetime]]:
+        """
+        Receive frames for up to `max_wait_ms` and return all of their feeds in a single list
 
-                else:
-                    continue
+        Blocks until at least one frame is received, returns an empty list once disconnected
+        """
+        deadline = monotonic() + max_wait_ms / 1000
+        feeds: List[Tuple[StreamingTopic, Any, datetime]] = []
 
-        raise StopIteration
+        for invokations, reply in self.__lc:
+            if invokations is not None:
+                feeds.extend(map(self.__process_invokation, filter(None, invokations)))
+
+            elif reply:
+                self.__tc.process_reply(reply)
+
+            if monotonic() >= deadline:
+                break
+
+        return feeds
 
     @property
-    def connected(self):
+    def connected(self) -> bool:
         return self.__lc.connected
 
     @property
-    def timing_client(self):
+    def timing_client(self) -> F1TimingClient:
         return self.__tc
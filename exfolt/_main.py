@@ -16,16 +16,16 @@
 
 from __future__ import annotations
 from argparse import ArgumentParser
+from collections import deque
 from collections.abc import Mapping
 from datetime import datetime, timezone
 from enum import StrEnum
-from json import dumps, loads
+from json import dumps
 from logging import DEBUG, FileHandler, Formatter, getLogger, INFO, StreamHandler
 from os import environ
 from pathlib import Path
-from queue import Empty, Queue
 from pkg_resources import require
-from typing import List, NotRequired, TypedDict
+from typing import Deque, Dict, List, NotRequired, Tuple, TypedDict
 
 from dotenv import dotenv_values
 
@@ -33,7 +33,7 @@ from ._client import F1ArchiveClient, F1LiveClient, F1LiveTimingClient
 from ._type import ArchiveStatus, AudioStream, ContentStream, Driver, ExtrapolatedClock, \
     FlagStatus, RaceControlMessage, SessionInfo, SessionStatus, StreamingTopic, TeamRadioCapture, \
     TrackStatus, TrackStatusStatus
-from ._utils import decompress_zlib_data
+from ._utils import decompress_zlib_data, json_loads
 
 
 class __DiscordEnv(TypedDict):
@@ -59,6 +59,19 @@ class __DiscordEnv(TypedDict):
     YELLOW_FLAG_EMOJI: str
 
 
+__flag_styles: Dict[FlagStatus, Tuple[int, Tuple[str, ...]]] = {
+    FlagStatus.BLACK: (0x000000, ("BLACK_FLAG_EMOJI",)),
+    FlagStatus.BLACK_AND_ORANGE: (0xFFA500, ("BLACK_ORANGE_FLAG_EMOJI",)),
+    FlagStatus.BLACK_AND_WHITE: (0xFFA500, ("BLACK_WHITE_FLAG_EMOJI",)),
+    FlagStatus.BLUE: (0x0000FF, ("BLUE_FLAG_EMOJI",)),
+    FlagStatus.CHEQUERED: (0xFFFFFF, ("CHEQUERED_FLAG_EMOJI",)),
+    FlagStatus.CLEAR: (0xFFFFFF, ("GREEN_FLAG_EMOJI",)),
+    FlagStatus.GREEN: (0x00FF00, ("GREEN_FLAG_EMOJI",)),
+    FlagStatus.YELLOW: (0xFFFF00, ("YELLOW_FLAG_EMOJI",)),
+    FlagStatus.DOUBLE_YELLOW: (0xFFA500, ("YELLOW_FLAG_EMOJI", "YELLOW_FLAG_EMOJI")),
+    FlagStatus.RED: (0xFF0000, ("RED_FLAG_EMOJI",)),
+}
+
 try:
     from exdc.client import REST as DiscordRESTClient
     from exdc.exception import RESTException
@@ -261,99 +274,51 @@ try:
             EmbedField(name="Category", value=rcm_msg["Category"]),
         ]
 
-        if "RacingNumber" in rcm_msg:
-            if driver:
-                assert rcm_msg["RacingNumber"] == driver["RacingNumber"]
-                headshot_url = None
-
-                if "HeadshotUrl" in driver:
-                    headshot_url = driver["HeadshotUrl"]
+        racing_number = rcm_msg.get("RacingNumber")
 
+        if racing_number is not None:
+            if driver:
+                assert racing_number == driver["RacingNumber"]
+                headshot_url = driver.get("HeadshotUrl")
                 driver_name = f"{driver['FirstName']} {driver['LastName']} " + \
                     f"({driver['RacingNumber']})"
                 author = EmbedAuthor(name=driver_name, icon_url=headshot_url)
 
             else:
                 author = None
-                fields.append(EmbedField(name="Racing Number", value=rcm_msg["RacingNumber"]))
+                fields.append(EmbedField(name="Racing Number", value=racing_number))
 
         else:
             author = None
 
-        if "Flag" in rcm_msg:
-            if rcm_msg["Flag"] == FlagStatus.BLACK:
-                color = 0x000000
-                description = discord_env["BLACK_FLAG_EMOJI"]
-
-            elif rcm_msg["Flag"] == FlagStatus.BLACK_AND_ORANGE:
-                color = 0xFFA500
-                description = discord_env["BLACK_ORANGE_FLAG_EMOJI"]
-
-            elif rcm_msg["Flag"] == FlagStatus.BLACK_AND_WHITE:
-                color = 0xFFA500
-                description = discord_env["BLACK_WHITE_FLAG_EMOJI"]
-
-            elif rcm_msg["Flag"] == FlagStatus.BLUE:
-                color = 0x0000FF
-                description = discord_env["BLUE_FLAG_EMOJI"]
-
-            elif rcm_msg["Flag"] in (FlagStatus.CHEQUERED, FlagStatus.CLEAR):
-                color = 0xFFFFFF
-
-                if rcm_msg["Flag"] == FlagStatus.CLEAR:
-                    description = discord_env["GREEN_FLAG_EMOJI"]
-
-                else:
-                    description = discord_env["CHEQUERED_FLAG_EMOJI"]
-
-            elif rcm_msg["Flag"] == FlagStatus.GREEN:
-                color = 0x00FF00
-                description = discord_env["GREEN_FLAG_EMOJI"]
-
-            elif rcm_msg["Flag"] == FlagStatus.YELLOW:
-                color = 0xFFFF00
-                description = discord_env["YELLOW_FLAG_EMOJI"]
-
-            elif rcm_msg["Flag"] == FlagStatus.DOUBLE_YELLOW:
-                color = 0xFFA500
-                description = "".join((discord_env["YELLOW_FLAG_EMOJI"],
-                                       discord_env["YELLOW_FLAG_EMOJI"]))
-
-            elif rcm_msg["Flag"] == FlagStatus.RED:
-                color = 0xFF0000
-                description = discord_env["RED_FLAG_EMOJI"]
-
-            else:
-                color = 0XA6EF1F
-                description = None
+        flag = rcm_msg.get("Flag")
 
-            fields.append(EmbedField(name="Flag", value=str(rcm_msg["Flag"])))
+        if flag is not None:
+            color, emojis = __flag_styles.get(flag, (0XA6EF1F, ()))
+            description = "".join(discord_env[emoji] for emoji in emojis) or None
+            fields.append(EmbedField(name="Flag", value=str(flag)))
 
         else:
             color = None
             description = None
 
-        if "Status" in rcm_msg:
+        status = rcm_msg.get("Status")
+
+        if status is not None:
             if rcm_msg["Category"] == "Drs":
-                fields.append(EmbedField(name="DRS Status", value=rcm_msg["Status"]))
+                fields.append(EmbedField(name="DRS Status", value=status))
 
             elif rcm_msg["Category"] == "SafetyCar":
-                fields.append(EmbedField(name="Safety Car Status", value=rcm_msg["Status"]))
+                fields.append(EmbedField(name="Safety Car Status", value=status))
 
             else:
-                fields.append(EmbedField(name="Status", value=rcm_msg["Status"]))
-
-        if "Lap" in rcm_msg:
-            fields.append(EmbedField(name="Lap", value=str(rcm_msg["Lap"])))
+                fields.append(EmbedField(name="Status", value=status))
 
-        if "Mode" in rcm_msg:
-            fields.append(EmbedField(name="Mode", value=rcm_msg["Mode"]))
+        for key in ("Lap", "Mode", "Scope", "Sector"):
+            value = rcm_msg.get(key)
 
-        if "Scope" in rcm_msg:
-            fields.append(EmbedField(name="Scope", value=rcm_msg["Scope"]))
-
-        if "Sector" in rcm_msg:
-            fields.append(EmbedField(name="Sector", value=str(rcm_msg["Sector"])))
+            if value is not None:
+                fields.append(EmbedField(name=key, value=str(value)))
 
         return Embed(title="Race Control Message", author=author, color=color,
                      description=description, fields=fields,
@@ -385,12 +350,7 @@ try:
     def __team_radio_embed(team_radio: TeamRadioCapture, timestamp: datetime | None = None,
                            driver: Driver | None = None, session_path: str | None = None):
         if driver:
-            if "HeadshotUrl" in driver:
-                headshot_url = driver["HeadshotUrl"]
-
-            else:
-                headshot_url = None
-
+            headshot_url = driver.get("HeadshotUrl")
             driver_name = f"{driver['FirstName']} {driver['LastName']} " + \
                 f"({driver['RacingNumber']})"
             author = EmbedAuthor(name=driver_name, icon_url=headshot_url)
@@ -818,7 +778,7 @@ def __program_main():
             for topic, data, timedelta in archive_client:
                 if topic in [StreamingTopic.CAR_DATA_Z, StreamingTopic.POSITION_Z] and \
                         args.archived_b64_zlib_decode:
-                    message_logger.info(dumps([topic, loads(decompress_zlib_data(data)),
+                    message_logger.info(dumps([topic, json_loads(decompress_zlib_data(data)),
                                                timedelta], separators=(",", ":")))
 
                 else:
@@ -920,7 +880,7 @@ def __program_main():
                             ] and args.live_b64_zlib_decode:
                                 message_logger.info(dumps([
                                     invokation["A"][0],
-                                    loads(decompress_zlib_data(invokation["A"][1])),
+                                    json_loads(decompress_zlib_data(invokation["A"][1])),
                                     invokation["A"][2]], separators=(",", ":")))
 
                             else:
@@ -934,163 +894,156 @@ def __program_main():
             logger.warning("F1 Live Timing API Streaming Status: Offline!")
 
         discord_env = __discord_env(args.discord_env_path)
-        embed_queue: Queue[Embed] = Queue()
+        embed_queue: Deque[Embed] = deque()
 
         try:
             with F1LiveTimingClient(*topics) as lt_client:
                 logger.info("F1 Live Timing streaming feed Discord bot started!")
+                timing_client = lt_client.timing_client
+                append_embed = embed_queue.append
 
-                for feeds in lt_client:
-                    for topic, change, timestamp in feeds:
+                while lt_client.connected:
+                    for topic, change, timestamp in lt_client.drain(0):
                         if topic == StreamingTopic.ARCHIVE_STATUS:
-                            assert lt_client.timing_client.archive_status
-                            archive_status = lt_client.timing_client.archive_status
+                            assert timing_client.archive_status
+                            archive_status = timing_client.archive_status
 
-                            embed_queue.put(__archive_status_embed(archive_status,
-                                                                   timestamp=timestamp))
+                            append_embed(__archive_status_embed(archive_status,
+                                                                timestamp=timestamp))
 
                         elif topic == StreamingTopic.AUDIO_STREAMS:
-                            assert lt_client.timing_client.audio_streams
-                            audio_streams = lt_client.timing_client.audio_streams
-                            session_info = lt_client.timing_client.session_info
+                            assert timing_client.audio_streams
+                            audio_streams = timing_client.audio_streams
+                            session_info = timing_client.session_info
                             session_path = session_info["Path"] if session_info else None
 
                             if isinstance(change["Streams"], Mapping):
                                 for key in change["Streams"].keys():
-                                    audio_stream = audio_streams[int(key)]
+                                    audio_stream = audio_streams["Streams"][int(key)]
 
-                                    embed_queue.put(__audio_stream_embed(audio_stream,
-                                                                         session_path=session_path,
-                                                                         timestamp=timestamp))
+                                    append_embed(__audio_stream_embed(audio_stream,
+                                                                      session_path=session_path,
+                                                                      timestamp=timestamp))
 
                             else:
                                 assert isinstance(audio_streams["Streams"], list)
 
-                                for stream in audio_streams["Streams"]:
-                                    embed_queue.put(__audio_stream_embed(stream,
-                                                                         session_path=session_path,
-                                                                         timestamp=timestamp))
+                                embed_queue.extend(
+                                    __audio_stream_embed(stream, session_path=session_path,
+                                                         timestamp=timestamp)
+                                    for stream in audio_streams["Streams"]
+                                )
 
                         elif topic == StreamingTopic.CONTENT_STREAMS:
-                            assert lt_client.timing_client.content_streams
-                            content_streams = lt_client.timing_client.content_streams
-                            session_info = lt_client.timing_client.session_info
+                            assert timing_client.content_streams
+                            content_streams = timing_client.content_streams
+                            session_info = timing_client.session_info
                             session_path = session_info["Path"] if session_info else None
 
                             if isinstance(change["Streams"], Mapping):
                                 for key in change["Streams"].keys():
-                                    content_stream = content_streams[int(key)]
+                                    content_stream = content_streams["Streams"][int(key)]
 
-                                    embed_queue.put(__content_stream_embed(
+                                    append_embed(__content_stream_embed(
                                         content_stream, session_path=session_path,
                                         timestamp=timestamp))
 
                             else:
                                 assert isinstance(content_streams["Streams"], list)
 
-                                for stream in content_streams["Streams"]:
-                                    embed_queue.put(__content_stream_embed(
-                                        stream, session_path=session_path, timestamp=timestamp))
+                                embed_queue.extend(
+                                    __content_stream_embed(stream, session_path=session_path,
+                                                           timestamp=timestamp)
+                                    for stream in content_streams["Streams"]
+                                )
 
                         elif topic == StreamingTopic.DRIVER_LIST:
-                            continue
+                            pass
 
                         elif topic == StreamingTopic.EXTRAPOLATED_CLOCK:
-                            assert lt_client.timing_client.extrapolated_clock
-                            extrapolated_clock = lt_client.timing_client.extrapolated_clock
+                            assert timing_client.extrapolated_clock
+                            extrapolated_clock = timing_client.extrapolated_clock
 
-                            embed_queue.put(__extrapolated_clock_embed(extrapolated_clock,
-                                                                       timestamp=timestamp))
+                            append_embed(__extrapolated_clock_embed(extrapolated_clock,
+                                                                    timestamp=timestamp))
 
                         elif topic == StreamingTopic.RACE_CONTROL_MESSAGES:
-                            assert lt_client.timing_client.race_control_messages
-                            driver_list = lt_client.timing_client.driver_list
-                            race_control_messages = lt_client.timing_client.race_control_messages
+                            assert timing_client.race_control_messages
+                            driver_list = timing_client.driver_list
+                            race_control_messages = timing_client.race_control_messages
                             messages = change["Messages"]
 
                             if isinstance(messages, Mapping):
                                 for key in messages.keys():
                                     message = race_control_messages["Messages"][int(key)]
 
-                                    if "RacingNumber" in message and driver_list and \
-                                            message["RacingNumber"] in driver_list:
-                                        driver = driver_list[message["RacingNumber"]]
+                                    driver = driver_list.get(message.get("RacingNumber")) \
+                                        if driver_list else None
 
-                                    else:
-                                        driver = None
-
-                                    embed_queue.put(__race_control_message_embed(
+                                    append_embed(__race_control_message_embed(
                                         message, discord_env, timestamp=timestamp, driver=driver))
 
                             else:
                                 assert isinstance(race_control_messages["Messages"], list)
 
-                                for message in race_control_messages["Messages"]:
-                                    if "RacingNumber" in message and driver_list and \
-                                            message["RacingNumber"] in driver_list:
-                                        driver = driver_list[message["RacingNumber"]]
-
-                                    else:
-                                        driver = None
-
-                                    embed_queue.put(__race_control_message_embed(
-                                        message, discord_env, timestamp=timestamp, driver=driver))
+                                embed_queue.extend(
+                                    __race_control_message_embed(
+                                        message, discord_env, timestamp=timestamp,
+                                        driver=driver_list.get(message.get("RacingNumber"))
+                                        if driver_list else None)
+                                    for message in race_control_messages["Messages"]
+                                )
 
                         elif topic == StreamingTopic.SESSION_INFO:
-                            assert lt_client.timing_client.session_info
-                            session_info = lt_client.timing_client.session_info
+                            assert timing_client.session_info
+                            session_info = timing_client.session_info
 
-                            embed_queue.put(__session_info_embed(session_info,
-                                                                 timestamp=timestamp))
+                            append_embed(__session_info_embed(session_info,
+                                                              timestamp=timestamp))
 
                         elif topic == StreamingTopic.SESSION_STATUS:
-                            assert lt_client.timing_client.session_status
-                            session_status = lt_client.timing_client.session_status
+                            assert timing_client.session_status
+                            session_status = timing_client.session_status
 
-                            embed_queue.put(__session_status_embed(session_status,
-                                                                   timestamp=timestamp))
+                            append_embed(__session_status_embed(session_status,
+                                                                timestamp=timestamp))
 
                         elif topic == StreamingTopic.TEAM_RADIO:
-                            assert lt_client.timing_client.team_radio
-                            team_radio = lt_client.timing_client.team_radio
-                            driver_list = lt_client.timing_client.driver_list
-                            session_info = lt_client.timing_client.session_info
+                            assert timing_client.team_radio
+                            team_radio = timing_client.team_radio
+                            driver_list = timing_client.driver_list
+                            session_info = timing_client.session_info
                             session_path = session_info["Path"] if session_info else None
                             captures = change["Captures"]
 
                             if isinstance(captures, Mapping):
                                 for key in captures.keys():
-                                    capture = team_radio["Captures"][key]
+                                    capture = team_radio["Captures"][int(key)]
 
-                                    if driver_list and capture["RacingNumber"] in driver_list:
-                                        driver = driver_list[capture["RacingNumber"]]
+                                    driver = driver_list.get(capture["RacingNumber"]) \
+                                        if driver_list else None
 
-                                    else:
-                                        driver = None
-
-                                    embed_queue.put(__team_radio_embed(
+                                    append_embed(__team_radio_embed(
                                         capture, timestamp=timestamp, driver=driver,
                                         session_path=session_path))
 
                             else:
                                 assert isinstance(team_radio["Captures"], list)
 
-                                for capture in team_radio["Captures"]:
-                                    if driver_list and capture["RacingNumber"] in driver_list:
-                                        driver = driver_list[capture["RacingNumber"]]
-
-                                    else:
-                                        driver = None
-
-                                    embed_queue.put(__team_radio_embed(
-                                        capture, timestamp=timestamp, driver=driver,
-                                        session_path=session_path))
+                                embed_queue.extend(
+                                    __team_radio_embed(
+                                        capture, timestamp=timestamp,
+                                        driver=driver_list.get(capture["RacingNumber"])
+                                        if driver_list else None,
+                                        session_path=session_path)
+                                    for capture in team_radio["Captures"]
+                                )
 
                         elif topic == StreamingTopic.TRACK_STATUS:
-                            assert lt_client.timing_client.track_status
-                            track_status = lt_client.timing_client.track_status
+                            assert timing_client.track_status
+                            track_status = timing_client.track_status
 
-                            embed_queue.put(__track_status_embed(
+                            append_embed(__track_status_embed(
                                 track_status, discord_env, timestamp=timestamp))
 
                         else:
@@ -1098,12 +1051,8 @@ def __program_main():
 
                     embeds: List[Embed] = []
 
-                    while len(embeds) < 10:
-                        try:
-                            embeds.append(embed_queue.get(block=False))
-
-                        except Empty:
-                            break
+                    while len(embeds) < 10 and len(embed_queue) > 0:
+                        embeds.append(embed_queue.popleft())
 
                     if len(embeds) > 0:
                         __message_embeds(discord_env, embeds)
@@ -1,9 +1,10 @@
 from __future__ import annotations
 from datetime import datetime, timedelta
 from http.cookies import SimpleCookie
-from json import dumps, loads
+from json import dumps
 from logging import getLogger
 from random import randint
+from types import TracebackType
 from typing import List, TypedDict
 from urllib.parse import quote, urlencode
 
@@ -12,6 +13,7 @@ from websocket import WebSocket, WebSocketBadStatusException, WebSocketConnectio
     WebSocketTimeoutException
 
 from ._type import JSONValueDataType
+from ._utils import json_loads
 
 
 class SignalRNegotiationData(TypedDict):
@@ -74,7 +76,8 @@ class SignalRClient:
         SignalRClient.__logger.info("Entering SignalR client context!")
         return self.open()
 
-    def __exit__(self, *args):
+    def __exit__(self, exc_type: type[BaseException] | None, exc: BaseException | None,
+                 tb: TracebackType | None):
         SignalRClient.__logger.info("Exiting SignalR client context!")
         self.close()
 
@@ -285,7 +288,7 @@ class SignalRClient:
                 opcode, raw_data = self.__ws_transport.recv_data()
                 opcode: int
                 raw_data: bytes
-                json_data: SignalRData = loads(raw_data)
+                json_data: SignalRData = json_loads(raw_data)
                 id = self.__negotiation_data["ConnectionId"]
 
                 if len(json_data) == 0:
@@ -348,7 +351,7 @@ class SignalRClient:
     def invoke(self, hub: str, method: str, *args: JSONValueDataType):
         assert hub in self.__hubs
         data: SignalRInvokation = {"H": hub, "M": method, "A": [arg for arg in args]}
-        data |= {"I": self.__command_id}
+        data["I"] = self.__command_id
         self.__send(dumps(data, separators=(",", ":")))
         self.__command_id += 1
 
@@ -15,10 +15,18 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from base64 import b64decode
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta
+from functools import lru_cache
 from zlib import decompress, MAX_WBITS
 
+try:
+    from orjson import loads as json_loads
 
+except ImportError:
+    from json import loads as json_loads  # noqa: F401
+
+
+@lru_cache(maxsize=1024)
 def datetime_parser(datetime_str: str):
     assert (
         "Z" in datetime_str and datetime_str.count("Z") == 1 and datetime_str.endswith("Z") and
@@ -28,20 +36,11 @@ def datetime_parser(datetime_str: str):
         f"Received datetime string: {datetime_str}",
     ))
 
-    [date, time] = datetime_str.replace("Z", "").split("T")
-    assert date.count("-") == 2, f"Unexpected date string format {datetime_str}!"
-    assert time.count(":") == 2, f"Unexpected date string format {datetime_str}!"
-
-    [year, month, day] = date.split("-")
-    [hour, minute, second] = time.split(":")
-    microsecond = int(float("0." + second.split(".")[1]) * (10 ** 6)) if "." in second else 0
-
-    return datetime(int(year), int(month), int(day), hour=int(hour), minute=int(minute),
-                    second=int(second.split(".")[0]), microsecond=microsecond, tzinfo=timezone.utc)
+    return datetime.fromisoformat(datetime_str)
 
 
-def decompress_zlib_data(data: str):
-    return decompress(b64decode(data.encode("ascii")), -MAX_WBITS).decode("utf8")
+def decompress_zlib_data(data: str | bytes):
+    return decompress(b64decode(data), -MAX_WBITS)
 
 
 def laptime_parser(laptime_str: str):